@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that caches successful token lookups.
+
+    Authenticated requests rebuild the user from the cached ``pk``, ``is_active``
+    and ``is_staff`` for ``cache_timeout`` seconds instead of querying the token
+    and user on every request. No other user fields, such as the password hash,
+    are cached, so they are unset on users built from the cache. A revoked token
+    or deactivated user is accepted until its cache entry expires.
+    """
+    cache_timeout = 30
+
+    def authenticate_credentials(self, key):
+        cache_key = f'tok:{key}'
+        cached_user = cache.get(cache_key)
+        if cached_user is not None:
+            user = get_user_model()(**cached_user)
+            return (user, self.get_model()(key=key, user=user))
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(
+            cache_key,
+            {'pk': user.pk, 'is_active': user.is_active, 'is_staff': user.is_staff},
+            self.cache_timeout,
+        )
+        return (user, token)
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-15 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('healthcare', '0002_user_role_index_appointment_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='medicalrecord',
+            index=models.Index(fields=['created_at'], name='record_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-15 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('healthcare', '0003_medicalrecord_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['appointment_time'], name='appt_time_idx'),
+        ),
+    ]
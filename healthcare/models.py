@@ -3,6 +3,43 @@ from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
+def _updates_any(update_fields, *fields):
+    """
+    Check whether a save touches any of the given fields.
+
+    Args:
+        update_fields (Iterable[str] | None): The ``update_fields`` passed to ``save()``.
+        *fields (str): The field names a validation depends on.
+
+    Returns:
+        bool: True when all fields are saved or any of the given fields is updated.
+    """
+    return update_fields is None or not set(fields).isdisjoint(update_fields)
+
+def _check_user_role(profile, role):
+    """
+    Check that a newly created profile is linked to a user with the given role.
+
+    Roles are only checked when the profile is inserted, so appointments can rely
+    on them without loading the user. The user row is reused when it was loaded
+    with select_related, otherwise only the role column is fetched.
+
+    Args:
+        profile (Doctor | Patient): The profile being saved.
+        role (str): The role the linked user must have.
+
+    Raises:
+        ValidationError: If the linked user does not have the given role.
+    """
+    if not profile._state.adding:
+        return
+    if profile._meta.get_field('user').is_cached(profile):
+        user_role = profile.user.role
+    else:
+        user_role = User.objects.filter(pk=profile.user_id).values_list('role', flat=True).first()
+    if user_role != role:
+        raise ValidationError(f"The user must be a {role}.")
+
 class User(AbstractUser):
     """
     Custom User model extending Django's AbstractUser.
@@ -14,7 +51,7 @@ class User(AbstractUser):
         ('doctor', 'Doctor'),
         ('patient', 'Patient'),
     )
-    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES, db_index=True)
     
     groups = models.ManyToManyField(
         Group,
@@ -65,14 +102,19 @@ class Doctor(models.Model):
 
     def save(self, *args, **kwargs):
         """
-        Override save method to validate specialization and experience years.
+        Override save method to validate the user role, specialization and experience years.
+
+        Validation is skipped for fields excluded by ``update_fields``.
 
         Raises:
-            ValidationError: If specialization is empty or experience years are negative.
+            ValidationError: If the user is not a doctor, specialization is empty or
+                experience years are negative.
         """
-        if not self.specialization:
+        _check_user_role(self, 'doctor')
+        update_fields = kwargs.get('update_fields')
+        if _updates_any(update_fields, 'specialization') and not self.specialization:
             raise ValidationError("Specialization cannot be empty.")
-        if self.experience_years < 0:
+        if _updates_any(update_fields, 'experience_years') and self.experience_years < 0:
             raise ValidationError("Experience years cannot be negative.")
         super().save(*args, **kwargs)
 
@@ -102,12 +144,19 @@ class Patient(models.Model):
 
     def save(self, *args, **kwargs):
         """
-        Override save method to validate date of birth.
+        Override save method to validate the user role and date of birth.
+
+        Date of birth validation is skipped when ``update_fields`` excludes it.
 
         Raises:
-            ValidationError: If date of birth is in the future.
+            ValidationError: If the user is not a patient or date of birth is in the future.
         """
-        if self.date_of_birth and self.date_of_birth > timezone.now().date():
+        _check_user_role(self, 'patient')
+        if (
+            _updates_any(kwargs.get('update_fields'), 'date_of_birth')
+            and self.date_of_birth
+            and self.date_of_birth > timezone.now().date()
+        ):
             raise ValidationError("Date of birth cannot be in the future.")
         super().save(*args, **kwargs)
 
@@ -139,19 +188,27 @@ class Appointment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['doctor', 'appointment_time'], name='appt_doctor_time_idx'),
+            models.Index(fields=['patient', 'appointment_time'], name='appt_patient_time_idx'),
+            models.Index(fields=['status', 'appointment_time'], name='appt_status_time_idx'),
+            models.Index(fields=['appointment_time'], name='appt_time_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         """
-        Override save method to validate appointment time and user roles.
+        Override save method to validate appointment time.
+
+        Patient and doctor roles are enforced when their profiles are created, so they are
+        not re-checked here. Validation is skipped when ``update_fields`` excludes the
+        appointment time.
 
         Raises:
-            ValidationError: If appointment time is in the past or user roles are incorrect.
+            ValidationError: If appointment time is in the past.
         """
-        if self.appointment_time < timezone.now():
+        if _updates_any(kwargs.get('update_fields'), 'appointment_time') and self.appointment_time < timezone.now():
             raise ValidationError("Appointment time cannot be in the past.")
-        if self.patient.user.role != 'patient':
-            raise ValidationError("The user must be a patient.")
-        if self.doctor.user.role != 'doctor':
-            raise ValidationError("The user must be a doctor.")
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -175,14 +232,21 @@ class MedicalRecord(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='record_created_at_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         """
         Override save method to validate notes.
 
+        Validation is skipped when ``update_fields`` excludes the notes.
+
         Raises:
             ValidationError: If notes are empty.
         """
-        if not self.notes:
+        if _updates_any(kwargs.get('update_fields'), 'notes') and not self.notes:
             raise ValidationError("Notes cannot be empty.")
         super().save(*args, **kwargs)
 
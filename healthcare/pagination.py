@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+class AppointmentCursorPagination(CursorPagination):
+    """
+    Cursor pagination for appointment lists.
+    Pages are keyed on the appointment time, so deep pages do not need OFFSET scans.
+    """
+    ordering = '-appointment_time'
+    page_size = 50
+
+class MedicalRecordCursorPagination(CursorPagination):
+    """
+    Cursor pagination for medical record lists.
+    Pages are keyed on the creation time, so deep pages do not need OFFSET scans.
+    """
+    ordering = '-created_at'
+    page_size = 50
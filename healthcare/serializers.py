@@ -1,9 +1,75 @@
 from rest_framework import serializers
 from .models import User, Doctor, Patient, Appointment, MedicalRecord
+from .utils import REMINDER_BATCH_SIZE
 from django.utils import timezone
 from django.contrib.auth import authenticate
+from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
 
 
+def _request_now(context):
+    """
+    Get the current time once per serializer context.
+
+    The value is stored in the context so every validator of a request, including
+    each item of a ``many=True`` payload, compares against the same instant.
+
+    Args:
+        context (dict): The serializer context.
+
+    Returns:
+        datetime: The current time for the request.
+    """
+    if '_now' not in context:
+        context['_now'] = timezone.now()
+    return context['_now']
+
+
+def _validate_user_password(attrs):
+    """
+    Check the submitted password once against ``AUTH_PASSWORD_VALIDATORS``.
+
+    Args:
+        attrs (dict): The user attributes being validated.
+
+    Raises:
+        serializers.ValidationError: If the password is too weak.
+    """
+    if 'password' not in attrs:
+        return
+    try:
+        validate_password(attrs['password'], User(**attrs))
+    except DjangoValidationError as e:
+        raise serializers.ValidationError({'password': list(e.messages)})
+
+
+def _create_user(validated_data):
+    """
+    Create a new user instance with a hashed password.
+
+    Username uniqueness is enforced by the database constraint rather than a
+    separate lookup, and a violation is reported as a validation error.
+
+    Args:
+        validated_data (dict): The validated data for creating a user.
+
+    Raises:
+        serializers.ValidationError: If the username already exists.
+
+    Returns:
+        User: The created user instance.
+    """
+    user = User(**validated_data)
+    user.set_password(validated_data['password'])
+    try:
+        with transaction.atomic():
+            user.save()
+    except IntegrityError:
+        raise serializers.ValidationError({'username': ["Username already exists."]})
+    return user
+
 class UserSerializer(serializers.ModelSerializer):
     """
     Serializer for User model.
@@ -16,7 +82,10 @@ class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'role', 'full_name', 'password']
-        extra_kwargs = {'password': {'write_only': True}}
+        extra_kwargs = {
+            'password': {'write_only': True},
+            'username': {'validators': [UnicodeUsernameValidator()]},
+        }
 
     def create(self, validated_data):
         """
@@ -28,44 +97,23 @@ class UserSerializer(serializers.ModelSerializer):
         Returns:
             User: The created user instance.
         """
-        user = User(**validated_data)
-        user.set_password(validated_data['password'])
-        user.save()
-        return user
-
-    def validate_username(self, value):
-        """
-        Validate that the username is unique.
+        return _create_user(validated_data)
 
-        Args:
-            value (str): The username to validate.
-
-        Raises:
-            serializers.ValidationError: If the username already exists.
-
-        Returns:
-            str: The validated username.
-        """
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("Username already exists.")
-        return value
-
-    def validate_password(self, value):
+    def validate(self, attrs):
         """
-        Validate the strength of the password.
+        Validate the password against the configured password validators.
 
         Args:
-            value (str): The password to validate.
+            attrs (dict): The user attributes.
 
         Raises:
-            serializers.ValidationError: If the password is less than 8 characters.
+            serializers.ValidationError: If the password is too weak.
 
         Returns:
-            str: The validated password.
+            dict: The validated attributes.
         """
-        if len(value) < 8:
-            raise serializers.ValidationError("Password must be at least 8 characters long.")
-        return value
+        _validate_user_password(attrs)
+        return attrs
 
 class DoctorSerializer(serializers.ModelSerializer):
     """
@@ -113,6 +161,31 @@ class DoctorSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Experience years cannot be negative.")
         return value
 
+class ListDoctorSerializer(serializers.Serializer):
+    """
+    Serializer for browsing Doctor profiles.
+
+    This serializer renders the fields needed to browse doctors from rows fetched
+    with ``values()``, so no Doctor instances are built for list responses.
+    """
+    id = serializers.IntegerField(read_only=True)
+    user = serializers.IntegerField(source='user_id', read_only=True)
+    username = serializers.CharField(source='user__username', read_only=True)
+    specialization = serializers.CharField(read_only=True)
+    availability = serializers.JSONField(read_only=True)
+
+class BulkDoctorSerializer(DoctorSerializer):
+    """
+    Serializer for bulk Doctor creation.
+
+    This serializer extends DoctorSerializer so that the linked user can be provided
+    for each doctor profile when seeding many profiles at once. Only doctor users are
+    accepted, since bulk inserts bypass the model's role check.
+    """
+    class Meta(DoctorSerializer.Meta):
+        read_only_fields = ['created_at', 'modified_at']
+        extra_kwargs = {'user': {'queryset': User.objects.filter(role='doctor')}}
+
 class PatientSerializer(serializers.ModelSerializer):
     """
     Serializer for Patient model.
@@ -142,53 +215,67 @@ class PatientSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Date of birth cannot be in the future.")
         return value
 
+class BulkPatientSerializer(PatientSerializer):
+    """
+    Serializer for bulk Patient creation.
+
+    This serializer extends PatientSerializer so that the linked user and email can be
+    provided for each patient profile when seeding many profiles at once. Only patient
+    users are accepted, since bulk inserts bypass the model's role check.
+    """
+    class Meta(PatientSerializer.Meta):
+        fields = PatientSerializer.Meta.fields + ['email']
+        read_only_fields = ['created_at', 'modified_at']
+        extra_kwargs = {'user': {'queryset': User.objects.filter(role='patient')}}
+
 class AppointmentSerializer(serializers.ModelSerializer):
     """
     Serializer for Appointment model.
 
     This serializer manages the serialization and validation of Appointment instances,
-    ensuring that appointment times are valid and associated users are of the correct roles.
+    ensuring that appointment times are valid. Patient and doctor roles are enforced when
+    their profiles are created, so only their ids are loaded here.
     """
+    patient = serializers.PrimaryKeyRelatedField(queryset=Patient.objects.only('id'))
+    doctor = serializers.PrimaryKeyRelatedField(queryset=Doctor.objects.only('id'))
+
     class Meta:
         model = Appointment
         fields = ['id', 'patient', 'doctor', 'appointment_time', 'status', 'created_at', 'modified_at']
         read_only_fields = ['created_at', 'modified_at']
 
-    def validate_appointment_time(self, value):
+    def update(self, instance, validated_data):
         """
-        Validate that the appointment time is not in the past.
+        Update an appointment, writing only the changed columns.
 
         Args:
-            value (datetime): The appointment time to validate.
-
-        Raises:
-            serializers.ValidationError: If the appointment time is in the past.
+            instance (Appointment): The appointment being updated.
+            validated_data (dict): The validated fields to change.
 
         Returns:
-            datetime: The validated appointment time.
+            Appointment: The updated appointment instance.
         """
-        if value < timezone.now():
-            raise serializers.ValidationError("Appointment time cannot be in the past.")
-        return value
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'modified_at'])
+        return instance
 
-    def validate(self, attrs):
+    def validate_appointment_time(self, value):
         """
-        Validate that the associated patient and doctor have the correct roles.
+        Validate that the appointment time is not in the past.
 
         Args:
-            attrs (dict): The attributes of the appointment.
+            value (datetime): The appointment time to validate.
 
         Raises:
-            serializers.ValidationError: If the patient or doctor role is incorrect.
+            serializers.ValidationError: If the appointment time is in the past.
 
         Returns:
-            dict: The validated attributes.
+            datetime: The validated appointment time.
         """
-        if attrs['patient'].user.role != 'patient':
-            raise serializers.ValidationError("The user must be a patient.")
-        if attrs['doctor'].user.role != 'doctor':
-            raise serializers.ValidationError("The user must be a doctor.")
-        return attrs
+        if value < _request_now(self.context):
+            raise serializers.ValidationError("Appointment time cannot be in the past.")
+        return value
 
 class MedicalRecordSerializer(serializers.ModelSerializer):
     """
@@ -219,18 +306,17 @@ class MedicalRecordSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Notes cannot be empty.")
         return value
 
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(serializers.Serializer):
     """
     Serializer for user registration.
 
     This serializer handles the serialization and validation of user registration data,
-    ensuring that the password is securely set.
+    ensuring that the password is securely set. Fields are declared explicitly so no
+    model introspection happens when the serializer is instantiated.
     """
-    password = serializers.CharField(write_only=True)
-
-    class Meta:
-        model = User
-        fields = ['username', 'password', 'role']
+    username = serializers.CharField(max_length=150, validators=[UnicodeUsernameValidator()])
+    password = serializers.CharField(write_only=True, min_length=8)
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES)
 
     def create(self, validated_data):
         """
@@ -242,10 +328,23 @@ class RegisterSerializer(serializers.ModelSerializer):
         Returns:
             User: The created user instance.
         """
-        user = User(**validated_data)
-        user.set_password(validated_data['password'])
-        user.save()
-        return user
+        return _create_user(validated_data)
+
+    def validate(self, attrs):
+        """
+        Validate the password against the configured password validators.
+
+        Args:
+            attrs (dict): The user attributes.
+
+        Raises:
+            serializers.ValidationError: If the password is too weak.
+
+        Returns:
+            dict: The validated attributes.
+        """
+        _validate_user_password(attrs)
+        return attrs
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -302,7 +401,20 @@ class AppointmentReminderSerializer(serializers.ModelSerializer):
         Returns:
             dict: The validated appointment data.
         """
-        if attrs['appointment_time'] <= timezone.now():
+        if attrs['appointment_time'] <= _request_now(self.context):
             raise serializers.ValidationError("Appointment time must be in the future.")
         
-        return attrs
\ No newline at end of file
+        return attrs
+
+class AppointmentReminderBatchSerializer(serializers.Serializer):
+    """
+    Serializer for batch appointment reminders.
+
+    This serializer validates the ids of existing appointments whose patients
+    should be reminded in a single batch, capped at one SMTP batch per request.
+    """
+    appointment_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=REMINDER_BATCH_SIZE,
+    )
@@ -3,8 +3,10 @@ from .views import (
     RegisterView,
     LoginView,
     DoctorListCreateView,
+    BulkDoctorCreateView,
     DoctorRetrieveUpdateDestroyView,
     PatientListCreateView,
+    BulkPatientCreateView,
     PatientRetrieveUpdateDestroyView,
     DoctorProfileView,
     PatientProfileView,
@@ -20,8 +22,10 @@ urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', LoginView.as_view(), name='login'),
     path('doctors/', DoctorListCreateView.as_view(), name='doctor_list_create'),
+    path('doctors/bulk/', BulkDoctorCreateView.as_view(), name='doctor_bulk_create'),
     path('doctors/<int:pk>/', DoctorRetrieveUpdateDestroyView.as_view(), name='doctor_detail'),
     path('patients/', PatientListCreateView.as_view(), name='patient_list_create'),
+    path('patients/bulk/', BulkPatientCreateView.as_view(), name='patient_bulk_create'),
     path('patients/<int:pk>/', PatientRetrieveUpdateDestroyView.as_view(), name='patient_detail'),
     path('doctors/<int:pk>/profile/', DoctorProfileView.as_view(), name='doctor_profile'),
     path('patients/<int:pk>/profile/', PatientProfileView.as_view(), name='patient_profile'),
@@ -1,29 +1,84 @@
 # utils.py
-from django.core.mail import send_mail
+from celery import shared_task
+from django.core.mail import send_mail, send_mass_mail
 from django.conf import settings
 
-def send_email_reminder(appointment):
+from .models import Appointment
+
+REMINDER_BATCH_SIZE = 50
+
+@shared_task
+def send_email_reminder(appointment_id):
     """
     Send an email reminder for a scheduled appointment.
 
-    This function constructs an email message with the appointment details
-    and sends it to the patient's email address.
+    This task re-fetches the appointment, constructs an email message with the
+    appointment details and sends it to the patient's email address.
 
     Args:
-        appointment (Appointment): The appointment object containing details
-            such as appointment time and the associated patient.
+        appointment_id (int): The primary key of the appointment to remind.
 
     Raises:
         Exception: If the email sending fails, an exception will be raised.
     """
-    subject = 'Appointment Reminder'
-    message = f'Reminder: You have an appointment scheduled for {appointment.appointment_time}.'
-    recipient_list = [appointment.patient.email]
+    appointment = _reminder_queryset().get(pk=appointment_id)
+    subject, message, from_email, recipient_list = _build_reminder_message(appointment)
 
     send_mail(
         subject,
         message,
-        settings.DEFAULT_FROM_EMAIL,
+        from_email,
         recipient_list,
         fail_silently=False,
     )
+
+@shared_task
+def send_email_reminders(appointment_ids, batch_size=REMINDER_BATCH_SIZE):
+    """
+    Send email reminders for several appointments over shared SMTP connections.
+
+    The appointments are fetched in a single query. Messages are grouped into
+    batches of ``batch_size`` and each batch is delivered with a single
+    ``send_mass_mail`` call, so one connection is opened per batch rather than
+    per appointment.
+
+    Args:
+        appointment_ids (list[int]): The primary keys of the appointments to remind.
+        batch_size (int): The number of messages sent per SMTP connection.
+
+    Raises:
+        Exception: If the email sending fails, an exception will be raised.
+
+    Returns:
+        int: The number of messages successfully delivered.
+    """
+    appointments = _reminder_queryset().filter(id__in=appointment_ids)
+    messages = [_build_reminder_message(appointment) for appointment in appointments]
+    sent = 0
+    for start in range(0, len(messages), batch_size):
+        sent += send_mass_mail(messages[start:start + batch_size], fail_silently=False)
+    return sent
+
+def _reminder_queryset():
+    """
+    Get the appointment queryset used to build reminders.
+
+    Returns:
+        QuerySet: Appointments joined with their patient, limited to the columns
+            needed by the reminder email.
+    """
+    return Appointment.objects.select_related('patient').only('appointment_time', 'patient__email')
+
+def _build_reminder_message(appointment):
+    """
+    Build the reminder email for an appointment.
+
+    Args:
+        appointment (Appointment): The appointment to build the reminder for.
+
+    Returns:
+        tuple: The subject, message, sender and recipient list of the email.
+    """
+    subject = 'Appointment Reminder'
+    message = f'Reminder: You have an appointment scheduled for {appointment.appointment_time}.'
+    return subject, message, settings.DEFAULT_FROM_EMAIL, [appointment.patient.email]
@@ -1,13 +1,21 @@
 from rest_framework import viewsets, generics, status
 from rest_framework.response import Response
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.authtoken.models import Token
-from rest_framework.exceptions import APIException
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.decorators import method_decorator
+from django.db import IntegrityError, transaction
+from django.db.transaction import non_atomic_requests
+from django.db.models import Count, Max
+from kombu.exceptions import OperationalError as BrokerOperationalError
 
 from .models import Doctor, Patient, Appointment, MedicalRecord
+from .pagination import AppointmentCursorPagination, MedicalRecordCursorPagination
 from .permissions import IsAdminOrReadOnly, IsDoctorOrReadOnly, IsPatientOrReadOnly
-from .serializers import DoctorSerializer, PatientSerializer, AppointmentSerializer, MedicalRecordSerializer, RegisterSerializer, LoginSerializer, AppointmentReminderSerializer
-from .utils import send_email_reminder  
+from .serializers import DoctorSerializer, PatientSerializer, AppointmentSerializer, MedicalRecordSerializer, RegisterSerializer, LoginSerializer, AppointmentReminderSerializer, AppointmentReminderBatchSerializer, BulkDoctorSerializer, BulkPatientSerializer, ListDoctorSerializer
+from .utils import send_email_reminder, send_email_reminders
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -21,8 +29,9 @@ class RegisterView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-        token, created = Token.objects.get_or_create(user=user)
+        with transaction.atomic():
+            user = serializer.save()
+            token = Token.objects.create(user=user)
 
         return Response({
             "user": serializer.data,
@@ -43,21 +52,68 @@ class LoginView(generics.GenericAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data
-        token, created = Token.objects.get_or_create(user=user)
+        token = Token.objects.filter(user_id=user.id).only('key').first() or Token.objects.create(user=user)
 
         return Response({"token": token.key}, status=status.HTTP_200_OK)
 
 
+class BulkCreateAPIView(generics.CreateAPIView):
+    """
+    Base API view for creating many instances in a single request.
+
+    The payload is validated as a list by the serializer, then inserted with
+    ``bulk_create`` in batches of ``batch_size`` instead of one INSERT per row.
+    Model ``save()`` overrides are not called, so the serializer must cover their validation.
+    Values of ``unique_fields`` must not repeat within a payload, since the per-item unique
+    validators only compare against rows already in the database.
+    """
+    batch_size = 500
+    unique_fields = ('user',)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        for field in self.unique_fields:
+            values = [attrs[field] for attrs in serializer.validated_data if field in attrs]
+            if len(values) != len(set(values)):
+                raise ValidationError({field: [f"Each {field} may only appear once."]})
+
+        model = serializer.child.Meta.model
+        try:
+            with transaction.atomic():
+                instances = model.objects.bulk_create(
+                    [model(**attrs) for attrs in serializer.validated_data],
+                    batch_size=self.batch_size,
+                )
+        except IntegrityError:
+            raise ValidationError("One or more rows conflict with existing records.")
+
+        return Response(self.get_serializer(instances, many=True).data, status=status.HTTP_201_CREATED)
+
+
+@method_decorator(non_atomic_requests, name='dispatch')
 class DoctorListCreateView(generics.ListCreateAPIView):
     """
     API view for listing and creating doctor profiles.
 
     Only admin users can create new doctor profiles. All users can view the list of doctors.
+    The list is read with ``values()`` and rendered by a lightweight serializer.
     """
     queryset = Doctor.objects.all()
     serializer_class = DoctorSerializer
     permission_classes = [IsAdminOrReadOnly]
 
+    def get_queryset(self):
+        if self.request.method == 'GET':
+            return Doctor.objects.values('id', 'user_id', 'user__username', 'specialization', 'availability')
+        return super().get_queryset()
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return ListDoctorSerializer
+        return super().get_serializer_class()
+
 
 class DoctorRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -70,6 +126,16 @@ class DoctorRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAdminOrReadOnly]
 
 
+class BulkDoctorCreateView(BulkCreateAPIView):
+    """
+    API view for seeding many doctor profiles at once.
+
+    Only admin users can create doctor profiles.
+    """
+    serializer_class = BulkDoctorSerializer
+    permission_classes = [IsAdminOrReadOnly]
+
+
 class PatientListCreateView(generics.ListCreateAPIView):
     """
     API view for listing and creating patient profiles.
@@ -85,11 +151,23 @@ class PatientRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting a specific patient profile.
 
-    Patients can modify their own profiles, while admin users can manage all patient profiles.
+    All users can view patient profiles; only admin users can modify or delete them. Requests
+    authenticate as ``auth.User``, which has no patient role or link to a patient profile, so
+    patient ownership cannot be checked here.
     """
     queryset = Patient.objects.all()
     serializer_class = PatientSerializer
-    permission_classes = [IsPatientOrReadOnly, IsAdminOrReadOnly]
+    permission_classes = [IsAdminOrReadOnly]
+
+
+class BulkPatientCreateView(BulkCreateAPIView):
+    """
+    API view for seeding many patient profiles at once.
+
+    Only admin users can create patient profiles in bulk.
+    """
+    serializer_class = BulkPatientSerializer
+    permission_classes = [IsAdminOrReadOnly]
 
 
 class DoctorAvailabilityView(generics.UpdateAPIView):
@@ -103,6 +181,7 @@ class DoctorAvailabilityView(generics.UpdateAPIView):
     permission_classes = [IsAuthenticated, IsDoctorOrReadOnly]
 
 
+@method_decorator(non_atomic_requests, name='dispatch')
 class PatientMedicalHistoryView(generics.RetrieveAPIView):
     """
     API view for patients to view their medical history.
@@ -114,48 +193,103 @@ class PatientMedicalHistoryView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated, IsPatientOrReadOnly]
 
 
+@method_decorator(non_atomic_requests, name='dispatch')
 class AvailableDoctorsView(generics.ListCreateAPIView):
     """
     API view for patients to view available doctors and book appointments.
 
     Only authenticated patients can view the list of available doctors and create appointments.
+    The serialized list is cached and keyed on the latest doctor modification, so it is rebuilt
+    only when a doctor profile is added, changed or removed.
     """
     queryset = Doctor.objects.all()
     serializer_class = DoctorSerializer
     permission_classes = [IsAuthenticated]
+    cache_timeout = 60
 
+    def list(self, request, *args, **kwargs):
+        state = Doctor.objects.aggregate(count=Count('id'), modified=Max('modified_at'))
+        modified = state['modified'].timestamp() if state['modified'] else 0
+        cache_key = f"avail_doctors:{state['count']}:{modified}"
 
-class DoctorAppointmentScheduleView(generics.ListUpdateAPIView):
+        data = cache.get_or_set(
+            cache_key,
+            lambda: self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data,
+            self.cache_timeout,
+        )
+        return Response(data)
+
+
+class DoctorAppointmentScheduleView(generics.ListAPIView):
     """
-    API view for doctors to view and manage their appointment schedule.
+    API view for doctors to view their appointment schedule.
 
-    Only authenticated doctors can view and update their appointment schedules.
+    Only authenticated users can view appointment schedules.
     """
     queryset = Appointment.objects.all()
     serializer_class = AppointmentSerializer
     permission_classes = [IsAuthenticated, IsDoctorOrReadOnly]
+    pagination_class = AppointmentCursorPagination
 
 
 
 class AppointmentReminderView(generics.CreateAPIView):
     """
     API view for sending appointment reminders via email.
+
+    Accepts either a single appointment or an ``appointment_ids`` list of existing
+    appointments. Reminders are queued as background tasks once the data is committed,
+    and lists are sent in batches so that SMTP connections are shared between messages.
     """
     queryset = Appointment.objects.all()
     serializer_class = AppointmentReminderSerializer
     permission_classes = [IsAuthenticated]
 
     def create(self, request, *args, **kwargs):
+        if 'appointment_ids' in request.data:
+            serializer = AppointmentReminderBatchSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            appointment_ids = serializer.validated_data['appointment_ids']
+            self.queue_reminder(send_email_reminders, appointment_ids)
+
+            return Response({"message": "Email reminders queued."}, status=status.HTTP_202_ACCEPTED)
+
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        
+
         appointment = serializer.save()
-        try:
-            send_email_reminder(appointment)
-        except Exception as e:
-            raise APIException(f"Failed to send email reminder: {str(e)}")
+        self.queue_reminder(send_email_reminder, appointment.id)
+
+        return Response({"message": "Email reminder queued."}, status=status.HTTP_202_ACCEPTED)
+
+    def queue_reminder(self, task, *args):
+        """
+        Queue a reminder task on the Celery broker.
 
-        return Response({"message": "Email reminder sent successfully."}, status=status.HTTP_201_CREATED)
+        Outside a transaction the task is queued immediately and broker failures are
+        reported to the client. Inside one, it is deferred until commit so it cannot
+        race the appointment write; a broker failure at that point can no longer reach
+        the response and is logged instead.
+
+        Args:
+            task (Task): The reminder task to queue.
+            *args: The arguments passed to the task.
+
+        Raises:
+            APIException: If no broker is configured or the broker cannot accept the task.
+        """
+        if not settings.CELERY_BROKER_URL:
+            raise APIException("Email reminders are not configured: CELERY_BROKER_URL is not set.")
+
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: task.delay(*args), robust=True)
+            return
+
+        try:
+            task.delay(*args)
+        except BrokerOperationalError as e:
+            raise APIException(f"Failed to queue email reminder: {str(e)}")
 
 
 class MedicalRecordListCreateView(generics.ListCreateAPIView):
@@ -167,6 +301,7 @@ class MedicalRecordListCreateView(generics.ListCreateAPIView):
     queryset = MedicalRecord.objects.all()
     serializer_class = MedicalRecordSerializer
     permission_classes = [IsAuthenticated, IsDoctorOrReadOnly]
+    pagination_class = MedicalRecordCursorPagination
 
 
 class MedicalRecordRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
@@ -0,0 +1,21 @@
+"""
+Celery config for healthcare_appointment_system project.
+
+It exposes the Celery application as a module-level variable named ``app``
+and discovers ``shared_task`` functions in the installed apps.
+
+For more information on this file, see
+https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'healthcare_appointment_system.settings')
+
+app = Celery('healthcare_appointment_system')
+
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+app.autodiscover_tasks()